@@ -5,45 +5,259 @@ import json
 import time
 from datetime import datetime
 import threading
+import os
+import atexit
+import multiprocessing
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+def _usable_cpu_count():
+    """Counts the CPUs this process may run on, honouring affinity and container CPU sets"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+MINING_BATCH_SIZE = 1024                    # Nonces tried per call to _mine_batch
+PARALLEL_CHUNK_SIZE = 64 * MINING_BATCH_SIZE  # Nonces handed to a worker process at a time
+# Parallel search hands out whole chunks, so it only wins once a block needs
+# several of them: on a warm pool a chunk round trip costs ~0.3 ms against
+# ~0.1 s of hashing per chunk, and an easier block is usually found inside
+# the first chunk anyway. Break-even is 16**difficulty >= 2 chunks (5 here)
+PARALLEL_MINING_DIFFICULTY = next(d for d in range(65) if 16 ** d >= 2 * PARALLEL_CHUNK_SIZE)
+MINING_WORKERS = _usable_cpu_count()        # Worker processes used for parallel mining
+
+def _canonical_prefix(index, tx_bytes, timestamp, previous_hash):
+    """
+    Serializes the block fields that stay fixed while mining
+    The layout never changes, so the bytes are formatted directly rather
+    than going through json.dumps with key sorting; the nonce goes last
+    """
+    return b'{"index":%d,"previous_hash":"%s","timestamp":%r,"transactions":%s,"nonce":' % (
+        index, previous_hash.encode(), timestamp, tx_bytes)
+
+def _canonical_bytes(index, tx_bytes, timestamp, previous_hash, nonce):
+    """Serializes a whole block in the canonical form that gets hashed"""
+    return _canonical_prefix(index, tx_bytes, timestamp, previous_hash) + b'%d}' % nonce
+
+def _mine_batch(prefix_hasher, target_hi, target, base_nonce, count=MINING_BATCH_SIZE):
+    """
+    Tries nonces base_nonce .. base_nonce + count - 1 in one tight loop
+    A digest passes when it is below `target`; its first 32 bits are checked
+    against `target_hi` first so nearly every attempt is rejected cheaply
+    Returns (nonce, digest) for the first one that passes, else None
+    """
+    from_bytes = int.from_bytes
+    resume = prefix_hasher.copy             # Bound once; called for every attempt
+    for nonce in range(base_nonce, base_nonce + count):
+        hasher = resume()                   # Resume from the prefix midstate
+        hasher.update(b'%d}' % nonce)       # Only the nonce tail is hashed per attempt
+        digest = hasher.digest()
+        if from_bytes(digest[:4], 'big') < target_hi and from_bytes(digest, 'big') < target:
+            return nonce, digest
+    return None
+
+def _mine_range(prefix_bytes, target_hi, target, base_nonce, count):
+    """
+    Worker process entry point: searches one nonce range
+    Hasher objects cannot be pickled, so the prefix midstate is rebuilt here
+    """
+    return _mine_batch(hashlib.sha256(prefix_bytes), target_hi, target, base_nonce, count)
+
+def _mine_serial(prefix_bytes, target_hi, target, start_nonce):
+    """Searches nonces one batch at a time in the calling thread"""
+    prefix_hasher = hashlib.sha256(prefix_bytes)
+    base_nonce = start_nonce
+    while True:
+        result = _mine_batch(prefix_hasher, target_hi, target, base_nonce)
+        if result is not None:
+            return result
+        base_nonce += MINING_BATCH_SIZE
+
+_mining_pool = None                         # Worker processes shared by every parallel search
+_mining_pool_lock = threading.Lock()
+
+def _get_mining_pool(workers):
+    """
+    Returns the shared worker pool, starting it on first use
+    Spawning interpreters costs far more than mining one block, so the
+    pool is kept for the rest of the session and shut down at exit
+    """
+    global _mining_pool
+    with _mining_pool_lock:
+        if _mining_pool is None:
+            context = multiprocessing.get_context('spawn')
+            _mining_pool = ProcessPoolExecutor(workers, mp_context=context)
+        return _mining_pool
+
+@atexit.register
+def _shutdown_mining_pool():
+    """Stops the shared worker pool, if one was started"""
+    global _mining_pool
+    with _mining_pool_lock:
+        if _mining_pool is not None:
+            _mining_pool.shutdown()
+            _mining_pool = None
+
+def _mine_parallel(prefix_bytes, target_hi, target, start_nonce, workers):
+    """
+    Searches consecutive nonce chunks in worker processes
+    hashlib only releases the GIL for large inputs, so threads would not
+    scale on short nonce tails. Chunks are collected in nonce order, so the
+    winning nonce is the same one a serial search would find
+    """
+    pool = _get_mining_pool(workers)
+    pending = deque()
+    next_nonce = start_nonce
+    try:
+        while True:
+            # Keep every worker busy with one chunk queued behind it
+            while len(pending) < 2 * workers:
+                pending.append(pool.submit(_mine_range, prefix_bytes, target_hi, target,
+                                           next_nonce, PARALLEL_CHUNK_SIZE))
+                next_nonce += PARALLEL_CHUNK_SIZE
+
+            result = pending.popleft().result()
+            if result is not None:
+                return result
+    except BrokenProcessPool:
+        _shutdown_mining_pool()             # Start a fresh pool for the next block
+        raise
+    finally:
+        for future in pending:
+            future.cancel()                 # Stop chunks that have not started yet
+
+def _mining_targets(difficulty):
+    """
+    Converts a difficulty into (target_hi, target) bounds for the hash
+    Each leading hex zero is one zero nibble, so the hash must be below
+    2^(256 - 4*difficulty); target_hi bounds its first 32 bits, and is 1
+    (first 32 bits all zero) once the difficulty goes past 8
+    """
+    if not 0 <= difficulty <= 64:
+        raise ValueError(f"Difficulty must be between 0 and 64, got {difficulty}")
+    target = 1 << (256 - 4 * difficulty)
+    return max(target >> 224, 1), target
+
+def _mine_nonce_serial(prefix_bytes, difficulty, start_nonce):
+    """Mining backend for single-core machines: always searches in the calling thread"""
+    target_hi, target = _mining_targets(difficulty)
+    return _mine_serial(prefix_bytes, target_hi, target, start_nonce)
+
+def _mine_nonce_parallel(prefix_bytes, difficulty, start_nonce):
+    """Mining backend for multi-core machines: worker processes for hard blocks"""
+    target_hi, target = _mining_targets(difficulty)
+    if difficulty >= PARALLEL_MINING_DIFFICULTY:
+        return _mine_parallel(prefix_bytes, target_hi, target, start_nonce, MINING_WORKERS)
+    return _mine_serial(prefix_bytes, target_hi, target, start_nonce)
+
+def _process_pool_supported():
+    """Checks whether worker processes can be started on this platform"""
+    try:
+        import multiprocessing.synchronize  # Fails where the OS lacks sem_open
+    except ImportError:
+        return False
+    return True
+
+def _select_mine_impl():
+    """
+    Picks the nonce search backend once, at import time
+    SHA-256 itself needs no choice here: hashlib uses OpenSSL, which
+    already detects SHA-NI/AVX2/SSSE3 at runtime. What varies is whether
+    the search can fan out across cores
+    """
+    if MINING_WORKERS > 1 and _process_pool_supported():
+        return _mine_nonce_parallel
+    return _mine_nonce_serial
 
 class Block:
     """
     Represents a single block in the blockchain
     Each block contains data, timestamp, hash, and reference to previous block
     """
+    _mine_impl = staticmethod(_select_mine_impl())  # Fastest nonce search for this machine
+
     def __init__(self, index, transactions, timestamp, previous_hash, nonce=0):
         self.index = index                    # Position of block in chain
         self.transactions = transactions      # List of transactions in this block
         self.timestamp = timestamp           # When block was created
         self.previous_hash = previous_hash   # Hash of previous block (creates the chain)
         self.nonce = nonce                   # Number used once for proof of work
-        self.hash = self.calculate_hash()    # This block's unique hash
+        self.tx_range = (0, 0)               # Slice of the chain's transaction columns
+        self._hash_bytes = self._digest()    # This block's unique hash (raw SHA-256 digest)
+        self._hash_hex = None                # Hex form, filled in on first use
+        self._render_cache = None            # Display text, filled in on first render()
+
+    @property
+    def hash(self):
+        """Hex form of the block hash, used for display and chain links"""
+        if self._hash_hex is None:
+            self._hash_hex = self._hash_bytes.hex()
+        return self._hash_hex
+
+    def _tx_bytes(self):
+        """Serializes the transaction list; done once per hash, never per nonce"""
+        return json.dumps(self.transactions, sort_keys=True, separators=(',', ':')).encode()
+
+    def _hash_prefix_bytes(self):
+        """
+        Serializes every block field except the nonce
+        The nonce is appended last, so this prefix stays the same while mining
+        """
+        return _canonical_prefix(self.index, self._tx_bytes(), self.timestamp, self.previous_hash)
 
-    def calculate_hash(self):
+    def _digest(self):
         """
         Creates a unique hash for this block using SHA-256
-        Combines all block data into a string and hashes it
+        Hashes the canonical serialization of the block
         """
-        block_string = json.dumps({
-            "index": self.index,
-            "transactions": self.transactions,
-            "timestamp": self.timestamp,
-            "previous_hash": self.previous_hash,
-            "nonce": self.nonce
-        }, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        return hashlib.sha256(_canonical_bytes(self.index, self._tx_bytes(), self.timestamp,
+                                               self.previous_hash, self.nonce)).digest()
 
     def mine_block(self, difficulty):
         """
         Proof of Work algorithm - finds a hash starting with required zeros
         Difficulty determines how many leading zeros are required
         """
-        target = "0" * difficulty            # Target pattern (e.g., "00" for difficulty 2)
-        while self.hash[:difficulty] != target:
-            self.nonce += 1                  # Try different nonce values
-            self.hash = self.calculate_hash()  # Recalculate hash
+        self.nonce, self._hash_bytes = self._mine_impl(self._hash_prefix_bytes(), difficulty,
+                                                       self.nonce)
+        self._hash_hex = None                # Digest changed, drop the stale hex form
+        self._render_cache = None            # ...and the stale display text
         print(f"Block mined: {self.hash}")
 
+    def render(self):
+        """
+        Formats this block and its transactions for display
+        A mined block never changes, so the text is built once and reused
+        """
+        if self._render_cache is not None:
+            return self._render_cache
+
+        parts = []
+        if self.index == 0:
+            parts.append("🔷 GENESIS BLOCK\n")
+        else:
+            parts.append(f"📦 BLOCK #{self.index}\n")
+        parts.append("-" * 40 + "\n")
+        parts.append(f"Hash: {self.hash[:50]}...\n")
+        parts.append(f"Previous Hash: {self.previous_hash[:50]}...\n")
+        parts.append(f"Timestamp: {datetime.fromtimestamp(self.timestamp).strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(f"Nonce: {self.nonce}\n")
+        parts.append(f"Transactions ({len(self.transactions)}):\n")
+        
+        if self.transactions:
+            for j, tx in enumerate(self.transactions, 1):
+                tx_type = "💰 MINING REWARD" if tx.get('type') == 'mining_reward' else "💸 TRANSFER"
+                from_addr = tx['from'] if tx['from'] != 'SYSTEM' else "SYSTEM"
+                parts.append(f"  {j}. {tx_type}: {from_addr} → {tx['to']}: {tx['amount']} coins\n")
+        else:
+            parts.append("  No transactions\n")
+        
+        parts.append("\n")
+        self._render_cache = ''.join(parts)
+        return self._render_cache
+
 class Blockchain:
     """
     Main blockchain class that manages the chain of blocks
@@ -55,6 +269,18 @@ class Blockchain:
         self.pending_transactions = []              # Transactions waiting to be mined
         self.mining_reward = 100                    # Reward for mining a block
 
+        self._addr_to_id = {}                       # Address -> small integer id
+        self._id_to_addr = []                       # Id -> address, for display
+        self._balances = array('d')                 # Id -> balance over all mined blocks
+        self._validated_upto = 0                    # Index of the last block known to be valid
+        self._mining_rewards = 0                    # Mining reward transactions mined so far
+
+        # Mined transactions stored column by column, one entry per transaction
+        self._tx_from = array('i')                  # Sender address ids
+        self._tx_to = array('i')                    # Receiver address ids
+        self._tx_amount = array('d')                # Transferred amounts
+        self._tx_is_reward = array('b')             # 1 for mining rewards, 0 for transfers
+
     def create_genesis_block(self):
         """
         Creates the first block in the blockchain
@@ -66,6 +292,20 @@ class Blockchain:
         """Returns the most recent block in the chain"""
         return self.chain[-1]
 
+    def _intern(self, address):
+        """
+        Returns the id for an address, assigning the next one on first sight
+        Only called from the mining thread; the id is published last so
+        get_balance on the GUI thread never sees an id without a balance slot
+        """
+        addr_id = self._addr_to_id.get(address)
+        if addr_id is None:
+            addr_id = len(self._id_to_addr)
+            self._id_to_addr.append(address)
+            self._balances.append(0.0)
+            self._addr_to_id[address] = addr_id
+        return addr_id
+
     def add_transaction(self, transaction):
         """
         Adds a new transaction to the pending transactions list
@@ -78,70 +318,104 @@ class Blockchain:
         Creates a new block with all pending transactions
         Always adds mining reward transaction and mines the block
         """
-        # Create a copy of pending transactions
-        transactions_to_mine = self.pending_transactions.copy()
+        # Take over the pending list and start a fresh one (no copy needed)
+        transactions_to_mine, self.pending_transactions = self.pending_transactions, []
         
         # Add mining reward transaction
         reward_transaction = {
             'from': 'SYSTEM',                # Mining rewards come from system
             'to': mining_reward_address,     # Miner gets the reward
             'amount': self.mining_reward,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'timestamp': time.time_ns(),     # Nanoseconds since epoch, formatted only for display
             'type': 'mining_reward'
         }
         transactions_to_mine.append(reward_transaction)
 
-        # Create new block with transactions
-        block = Block(
-            len(self.chain),                 # Block index
-            transactions_to_mine,            # All transactions including reward
-            time.time(),                     # Current timestamp
-            self.get_latest_block().hash     # Previous block's hash
-        )
-        
-        # Mine the block (proof of work)
-        block.mine_block(self.difficulty)
-        
-        # Add mined block to chain and clear pending transactions
+        try:
+            # Create new block with transactions
+            block = Block(
+                len(self.chain),                 # Block index
+                transactions_to_mine,            # All transactions including reward
+                time.time(),                     # Current timestamp
+                self.get_latest_block().hash     # Previous block's hash
+            )
+            
+            # Mine the block (proof of work)
+            block.mine_block(self.difficulty)
+
+            # Update balances and counts before the block becomes visible
+            self._record_transactions(block)
+        except Exception:
+            # Mining failed: put the taken transactions back ahead of any sent meanwhile
+            transactions_to_mine.pop()           # Drop the reward transaction
+            self.pending_transactions[:0] = transactions_to_mine
+            raise
+        
+        # Add mined block to chain last, so readers never see it half recorded
         self.chain.append(block)
-        self.pending_transactions = []
         
         return block
 
+    def _record_transactions(self, block):
+        """
+        Appends a newly mined block's transactions to the columns
+        Then applies that slice of the columns to the ledger and counters;
+        if a transaction cannot be stored, the columns are rolled back
+        """
+        columns = (self._tx_from, self._tx_to, self._tx_amount, self._tx_is_reward)
+        start = len(self._tx_amount)
+        try:
+            for transaction in block.transactions:
+                self._tx_from.append(self._intern(transaction['from']))
+                self._tx_to.append(self._intern(transaction['to']))
+                self._tx_amount.append(transaction['amount'])
+                self._tx_is_reward.append(transaction.get('type') == 'mining_reward')
+        except Exception:
+            for column in columns:
+                del column[start:]
+            raise
+        block.tx_range = (start, len(self._tx_amount))
+
+        balances = self._balances
+        for i in range(*block.tx_range):
+            if not self._tx_is_reward[i]:           # Rewards are minted, not sent
+                balances[self._tx_from[i]] -= self._tx_amount[i]
+            balances[self._tx_to[i]] += self._tx_amount[i]
+        self._mining_rewards += sum(self._tx_is_reward[start:])
+
     def get_balance(self, address):
         """
         Calculates balance for a given address
-        Goes through all transactions in all blocks
+        Reads the ledger that is updated as each block is mined
         """
-        balance = 0
-        
-        # Check all blocks in the chain
-        for block in self.chain:
-            # Check all transactions in each block
-            for transaction in block.transactions:
-                if transaction['from'] == address:
-                    balance -= transaction['amount']  # Subtract sent amount
-                if transaction['to'] == address:
-                    balance += transaction['amount']  # Add received amount
-        
-        return balance
+        addr_id = self._addr_to_id.get(address)
+        if addr_id is None:
+            return 0.0                              # Address never seen in a mined block
+        return self._balances[addr_id]
+
+    def get_transaction_counts(self):
+        """Returns (total transactions, mining rewards) across the chain"""
+        return len(self._tx_amount), self._mining_rewards
 
     def is_chain_valid(self):
         """
-        Validates the entire blockchain
-        Checks if all blocks are properly linked and not tampered with
+        Validates the blockchain
+        Checks if blocks are properly linked and not tampered with; blocks
+        that already passed are remembered, so only new blocks are rehashed
         """
-        for i in range(1, len(self.chain)):
+        for i in range(self._validated_upto + 1, len(self.chain)):
             current_block = self.chain[i]
             previous_block = self.chain[i-1]
             
             # Check if current block's hash is valid
-            if current_block.hash != current_block.calculate_hash():
+            if current_block._hash_bytes != current_block._digest():
                 return False
             
             # Check if current block properly references previous block
             if current_block.previous_hash != previous_block.hash:
                 return False
+
+            self._validated_upto = i
         
         return True
 
@@ -153,6 +427,7 @@ class BlockchainGUI:
     def __init__(self, root):
         self.root = root
         self.blockchain = Blockchain()  # Create new blockchain instance
+        self._rendered_upto = -1        # Index of the last block shown in the blockchain view
         
         # Configure main window
         self.root.title("🔗 Simple Blockchain Explorer")
@@ -323,7 +598,8 @@ class BlockchainGUI:
             bg='#2d2d2d',
             fg='#ffffff',
             insertbackground='#ffffff',
-            height=25
+            height=25,
+            state='disabled'        # Read-only; update_display unlocks it while redrawing
         )
         self.blockchain_text.pack(fill='both', expand=True, padx=20, pady=(0, 20))
 
@@ -423,7 +699,7 @@ class BlockchainGUI:
             # Check if sender has sufficient balance (skip for first transactions)
             balance = self.blockchain.get_balance(from_addr)
             if balance < amount:
-                messagebox.showerror("Error", f"Insufficient balance. Available: {balance} coins\n\nTip: Mine some blocks first to get coins!")
+                messagebox.showerror("Error", f"Insufficient balance. Available: {self._format_coins(balance)} coins\n\nTip: Mine some blocks first to get coins!")
                 return
             
             # Create and add transaction
@@ -431,7 +707,7 @@ class BlockchainGUI:
                 'from': from_addr,
                 'to': to_addr,
                 'amount': amount,
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'timestamp': time.time_ns(),
                 'type': 'transfer'
             }
             
@@ -460,7 +736,11 @@ class BlockchainGUI:
             return
         
         balance = self.blockchain.get_balance(address)
-        self.balance_label.config(text=f"Balance: {balance} coins")
+        self.balance_label.config(text=f"Balance: {self._format_coins(balance)} coins")
+
+    def _format_coins(self, amount):
+        """Formats a balance, showing whole amounts without a trailing '.0'"""
+        return str(int(amount)) if amount.is_integer() else str(amount)
 
     def mine_block(self):
         """
@@ -527,10 +807,27 @@ class BlockchainGUI:
         Updates all displays with current blockchain data
         Refreshes blockchain view and statistics
         """
-        # Update blockchain display
-        self.blockchain_text.delete(1.0, 'end')
-        blockchain_info = self.format_blockchain()
-        self.blockchain_text.insert(1.0, blockchain_info)
+        # Update blockchain display: blocks never change once mined, so only
+        # the header and pending sections are redrawn and new blocks appended
+        text = self.blockchain_text
+        text.config(state='normal')
+        if self._rendered_upto < 0 or not text.tag_ranges('header') or not text.tag_ranges('pending'):
+            # First draw, or the tagged sections are gone: redraw everything
+            text.delete(1.0, 'end')
+            self._rendered_upto = -1
+        else:
+            text.delete('header.first', 'header.last')
+            text.delete('pending.first', 'pending.last')
+
+        # Snapshot the new blocks once; the mining thread may append more meanwhile
+        new_blocks = self.blockchain.chain[self._rendered_upto + 1:]
+        chain_length = self._rendered_upto + 1 + len(new_blocks)
+        text.insert(1.0, self._format_header(chain_length), 'header')
+        for block in new_blocks:
+            text.insert('end', block.render())
+        self._rendered_upto += len(new_blocks)
+        text.insert('end', self._format_pending(), 'pending')
+        text.config(state='disabled')
         
         # Update statistics
         self.update_stats()
@@ -540,47 +837,32 @@ class BlockchainGUI:
         Formats blockchain data for display
         Creates a readable representation of all blocks
         """
-        output = "🔗 BLOCKCHAIN STATUS\n"
-        output += "=" * 60 + "\n\n"
-        output += f"Chain Length: {len(self.blockchain.chain)} blocks\n"
-        output += f"Pending Transactions: {len(self.blockchain.pending_transactions)}\n"
-        output += f"Mining Difficulty: {self.blockchain.difficulty}\n"
-        output += f"Chain Valid: {'✅ Yes' if self.blockchain.is_chain_valid() else '❌ No'}\n\n"
-        
-        # Display each block
-        for i, block in enumerate(self.blockchain.chain):
-            if i == 0:
-                output += f"🔷 GENESIS BLOCK\n"
-            else:
-                output += f"📦 BLOCK #{block.index}\n"
-            output += "-" * 40 + "\n"
-            output += f"Hash: {block.hash[:50]}...\n"
-            output += f"Previous Hash: {block.previous_hash[:50]}...\n"
-            output += f"Timestamp: {datetime.fromtimestamp(block.timestamp).strftime('%Y-%m-%d %H:%M:%S')}\n"
-            output += f"Nonce: {block.nonce}\n"
-            output += f"Transactions ({len(block.transactions)}):\n"
-            
-            if block.transactions:
-                for j, tx in enumerate(block.transactions, 1):
-                    tx_type = "💰 MINING REWARD" if tx.get('type') == 'mining_reward' else "💸 TRANSFER"
-                    from_addr = tx['from'] if tx['from'] != 'SYSTEM' else "SYSTEM"
-                    output += f"  {j}. {tx_type}: {from_addr} → {tx['to']}: {tx['amount']} coins\n"
-            else:
-                output += "  No transactions\n"
-            
-            output += "\n"
-        
-        # Display pending transactions
-        if self.blockchain.pending_transactions:
-            output += "⏳ PENDING TRANSACTIONS\n"
-            output += "-" * 40 + "\n"
-            for i, tx in enumerate(self.blockchain.pending_transactions, 1):
-                output += f"{i}. {tx['from']} → {tx['to']}: {tx['amount']} coins\n"
-            output += "\n💡 Mine a block to process these transactions!\n"
-        else:
-            output += "✅ No pending transactions\n"
-        
-        return output
+        chain = self.blockchain.chain[:]
+        return ''.join([self._format_header(len(chain))]
+                       + [block.render() for block in chain]
+                       + [self._format_pending()])
+
+    def _format_header(self, chain_length):
+        """Formats the chain summary shown above the given number of blocks"""
+        return (
+            "🔗 BLOCKCHAIN STATUS\n"
+            + "=" * 60 + "\n\n"
+            + f"Chain Length: {chain_length} blocks\n"
+            + f"Pending Transactions: {len(self.blockchain.pending_transactions)}\n"
+            + f"Mining Difficulty: {self.blockchain.difficulty}\n"
+            + f"Chain Valid: {'✅ Yes' if self.blockchain.is_chain_valid() else '❌ No'}\n\n"
+        )
+
+    def _format_pending(self):
+        """Formats the pending transactions shown below the blocks"""
+        if not self.blockchain.pending_transactions:
+            return "✅ No pending transactions\n"
+
+        parts = ["⏳ PENDING TRANSACTIONS\n", "-" * 40 + "\n"]
+        for i, tx in enumerate(self.blockchain.pending_transactions, 1):
+            parts.append(f"{i}. {tx['from']} → {tx['to']}: {tx['amount']} coins\n")
+        parts.append("\n💡 Mine a block to process these transactions!\n")
+        return ''.join(parts)
 
     def update_stats(self):
         """
@@ -590,8 +872,7 @@ class BlockchainGUI:
         self.stats_text.config(state='normal')
         self.stats_text.delete(1.0, 'end')
         
-        total_transactions = sum(len(block.transactions) for block in self.blockchain.chain)
-        mining_rewards = sum(1 for block in self.blockchain.chain for tx in block.transactions if tx.get('type') == 'mining_reward')
+        total_transactions, mining_rewards = self.blockchain.get_transaction_counts()
         regular_transactions = total_transactions - mining_rewards
         
         stats = f"""📊 BLOCKCHAIN STATISTICS